@@ -1,15 +1,11 @@
 import logging
-from .llm import get_provider, get_available_models, create_assistant
-from .terminal import get_history, get_current_dir
-from .config import load_config
-from .logging import get_logger
+import sys
+import time
 
 import click
 
 from .config import load_config
-from .llm import Provider, create_assistant
 from .logging import LoggerManager
-from .terminal import get_current_dir, get_current_shell, get_history
 
 
 @click.group(invoke_without_command=True)
@@ -82,6 +78,11 @@ def talk(
     Takes a prompt and returns a response from the assistant.
     """
 
+    # Imported here so `--help` and subcommands that never talk to a model
+    # do not pay for the LLM and tmux modules at startup.
+    from .llm import Provider, create_assistant
+    from .terminal import get_current_dir, get_current_shell, get_history
+
     logger = LoggerManager.get_logger(level=logging.DEBUG if verbose else logging.INFO)
     config = load_config()
 
@@ -110,7 +111,7 @@ def talk(
                 all_panes=all_panes or config.history_context_options.all_panes,
             )
             context.append(
-                f"The current terminal session I see is: \n" f"{'\n'.join(history)}"
+                "\n".join(["The current terminal session I see is: ", *history])
             )
 
     # Prepare the model
@@ -124,8 +125,16 @@ def talk(
         logger.warning(f"Model {model} not found.")
         return
     logger.info(f"Using model {model}")
+    # Write chunks straight to stdout and flush on newlines or every 50 ms,
+    # instead of paying a flush syscall for every streamed token.
+    out = sys.stdout
+    last_flush = time.monotonic()
     for response in assistant.assist(Provider.compose_messages(context, [prompt])):
-        print(response, end="", flush=True)
+        out.write(response)
+        if "\n" in response or time.monotonic() - last_flush > 0.05:
+            out.flush()
+            last_flush = time.monotonic()
+    out.flush()
 
 
 @cli.command()
@@ -1,11 +1,17 @@
 import os
 import sys
-from dataclasses import dataclass, field
+import threading
+from dataclasses import dataclass, field, fields
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+
+@dataclass(slots=True)
 class GenerationConfig:
     """
     Configuration settings for generation.
@@ -14,14 +20,18 @@ class GenerationConfig:
         temperature (float): The temperature setting for the model.
         top_p (float): The top-p setting for the model.
         with_tools (bool): Whether to use tools in generation.
+        flush_interval_ms (int): How long streamed chunks may be coalesced
+            before they are yielded, in milliseconds. 0 yields every chunk
+            immediately.
     """
 
     temperature: float = 0.7
     top_p: float = 1.0
     with_tools: bool = True
+    flush_interval_ms: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderConfig:
     """
     Configuration settings for a provider.
@@ -35,7 +45,7 @@ class ProviderConfig:
     api_key: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoryContextOptions:
     """
     Options for the history context.
@@ -49,7 +59,7 @@ class HistoryContextOptions:
     all_panes: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """
     Configuration settings for the term assistant application.
@@ -62,6 +72,8 @@ class Config:
         contexts (list): A list of contexts to be used.
         history_context_options (HistoryContextOptions): The history context options.
         providers (dict): A dictionary of provider configurations.
+        response_cache (bool): Whether to replay byte-identical requests from
+            the on-disk response cache instead of calling the model.
     """
 
     default_model: str = "openai/gpt-4o"
@@ -73,9 +85,7 @@ class Config:
         default_factory=HistoryContextOptions
     )
     providers: dict[str, ProviderConfig] = field(default_factory=dict)
-
-    def __getitem__(self, key):
-        return getattr(self, key)
+    response_cache: bool = False
 
     def __post_init__(self):
         if isinstance(self.generation, dict):
@@ -83,6 +93,7 @@ class Config:
                 temperature=self.generation.get("temperature", 0.7),
                 top_p=self.generation.get("top_p", 1.0),
                 with_tools=self.generation.get("with_tools", True),
+                flush_interval_ms=self.generation.get("flush_interval_ms", 10),
             )
         self.providers = {
             provider: (
@@ -98,20 +109,44 @@ class Config:
                 all_panes=self.history_context_options.get("all_panes", False),
             )
 
-    def get(self, key, default=None):
-        return getattr(self, key, default)
+    @classmethod
+    def from_dict(cls, data: dict) -> "Config":
+        """Build a Config from a parsed YAML dict.
+
+        Unknown keys are reported and dropped instead of raising a
+        TypeError, so a config written for a newer version still loads.
+
+        Args:
+            data (dict): The parsed configuration data
 
-    def update(self, **kwargs):
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        Returns:
+            Config: The configuration object
+        """
+
+        known_keys = {f.name for f in fields(cls)}
+        unknown_keys = data.keys() - known_keys
+        if unknown_keys:
+            print(f"Ignoring unknown config keys: {', '.join(sorted(unknown_keys))}")
+        return cls(**{key: data[key] for key in data.keys() & known_keys})
 
 
 DEFAULT_CONFIG = Config()
 
+_CONFIG_CACHE: dict[tuple[str, int], Config] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# Sentinel mtime for a missing config file, so the fallback to the default
+# configuration is cached (and reported) only once per process.
+_MISSING_FILE = -1
+
 
 def load_config() -> Config:
     """Load the configuration from the config file.
 
+    The parsed configuration is cached per (filename, mtime), so repeated
+    calls in the same process do not re-read or re-parse the file unless
+    it has changed on disk.
+
     Returns:
         Config: The configuration object
     """
@@ -120,14 +155,23 @@ def load_config() -> Config:
         "ASSISTANT_CONFIG", f'{os.path.expanduser("~")}/.assistant.yaml'
     )
     # load config file
-    if os.path.exists(filename):
-        with open(filename, "r") as f:
-            config = yaml.safe_load(f)
-            try:
-                return Config(**config)
-            except Exception as e:
-                print(f"Error loading config file: {e}")
-                sys.exit(1)
-    else:
-        print(f"Config file not found at {filename}, using defaults.")
-    return DEFAULT_CONFIG
+    try:
+        cache_key = (filename, os.stat(filename).st_mtime_ns)
+    except FileNotFoundError:
+        cache_key = (filename, _MISSING_FILE)
+    with _CONFIG_CACHE_LOCK:
+        if cache_key in _CONFIG_CACHE:
+            return _CONFIG_CACHE[cache_key]
+        if cache_key[1] == _MISSING_FILE:
+            print(f"Config file not found at {filename}, using defaults.")
+            loaded_config = DEFAULT_CONFIG
+        else:
+            with open(filename, "r") as f:
+                config = yaml.load(f, Loader=_YamlLoader)
+                try:
+                    loaded_config = Config.from_dict(config)
+                except Exception as e:
+                    print(f"Error loading config file: {e}")
+                    sys.exit(1)
+        _CONFIG_CACHE[cache_key] = loaded_config
+        return loaded_config
@@ -1,15 +1,206 @@
-import json
-from typing import Generator
+from __future__ import annotations
+
+import logging
+import sys
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncGenerator, Generator, TextIO, cast
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json  # type: ignore[no-redef]
 
-import litellm
 from colorama import Fore, Style
-from litellm.types.utils import ModelResponse, ModelResponseStream
 
 from .config import load_config
+from .llm_cache import ResponseCache
 from .logging import LoggerManager
-from .tools import tools
+from .tools import Tool, tools
+
+if TYPE_CHECKING:
+    import litellm
+    from litellm.types.utils import ModelResponse
+
+
+@lru_cache(maxsize=1)
+def _load_litellm():
+    """Import and configure litellm on first use.
+
+    The litellm import costs hundreds of milliseconds, so it is deferred
+    off CLI startup and only paid when a request is actually made. The
+    shared HTTP connection pools are installed here too: follow-up
+    requests (e.g. tool-call rounds) reuse warm TCP/TLS connections
+    instead of paying a new handshake each time, and the async pool
+    covers aassist the same way the sync pool covers assist.
+
+    Returns:
+        The configured litellm module
+    """
+
+    import httpx
+    import litellm
+
+    litellm.suppress_debug_info = True
+    limits = httpx.Limits(max_keepalive_connections=8)
+    timeout = httpx.Timeout(60.0, connect=5.0)
+    litellm.client_session = httpx.Client(limits=limits, timeout=timeout)
+    litellm.aclient_session = httpx.AsyncClient(limits=limits, timeout=timeout)
+    return litellm
+
+
+# Constant ANSI-colored fragments, built once instead of per yield
+_ROLE_TEMPLATE = Fore.GREEN + "{role}({model}): " + Style.RESET_ALL
+_TOOL_MSG_PREFIX = f"{Fore.GREEN}Using tool "
+_TOOL_MSG_SUFFIX = f"...{Style.RESET_ALL}"
+
+# Cap on buffered streamed content before a forced flush, so a long line
+# without newlines still appears incrementally.
+_MAX_BUFFER_CHARS = 64
+
+
+@lru_cache(maxsize=1)
+def _tools_payload() -> list:
+    """Build the tool schema list once per process.
+
+    The tools dict is static after import, so every completion call can
+    send the same payload object instead of rebuilding the list.
+    """
+
+    return [tool.openai_tool for tool in tools.values()]
+
+
+class _StreamRound:
+    """
+    Per-round chunk state machine shared by the sync and async streams.
+
+    ``feed`` turns one streamed chunk into zero or more printable
+    strings; the two driving loops differ only in how they iterate the
+    response. Once the stream is exhausted, ``next_messages`` holds the
+    follow-up message list when a tool round occurred, or None.
+    """
 
-litellm.suppress_debug_info = True
+    def __init__(self, provider: Provider, messages: list[litellm.AllMessageValues]):
+        from litellm.types.utils import ModelResponseStream
+
+        self._chunk_type = ModelResponseStream
+        self._provider = provider
+        self._messages = messages
+        self._logger = provider._logger
+        self._full_response_parts: list[str] = []
+        self._content_buffer: list[str] = []
+        self._buffered_chars: int = 0
+        self._last_yield: float = time.monotonic()
+        self._tool_call_id: str = ""
+        self._tool_name: str = ""
+        self._tool_args_parts: list[str] = []
+        self.next_messages: list[litellm.AllMessageValues] | None = None
+
+    def _flush(self) -> str:
+        out = "".join(self._content_buffer)
+        self._content_buffer.clear()
+        self._buffered_chars = 0
+        self._last_yield = time.monotonic()
+        return out
+
+    def _buffer(self, new_content: str) -> Generator[str, None, None]:
+        # Buffer the content and emit it in batches: coalescing chunks
+        # that arrive within the flush interval keeps the perceived
+        # streaming latency while cutting the per-token generator and
+        # write overhead.
+        self._full_response_parts.append(new_content)
+        self._content_buffer.append(new_content)
+        self._buffered_chars += len(new_content)
+        if (
+            "\n" in new_content
+            or self._buffered_chars >= _MAX_BUFFER_CHARS
+            or time.monotonic() - self._last_yield >= self._provider._flush_interval
+        ):
+            yield self._flush()
+
+    def feed(self, chunk: object) -> Generator[str, None, None]:
+        """Translate one streamed chunk into printable output."""
+
+        if not isinstance(chunk, self._chunk_type):
+            return
+
+        choice = chunk.choices[0]
+        message = choice.delta
+
+        # Fast path: almost every chunk is plain content with no role,
+        # tool call, or finish reason attached, so check that shape
+        # first and skip the full dispatch below.
+        new_content = message.content
+        if (
+            new_content is not None
+            and not choice.finish_reason
+            and not message.tool_calls
+            and not message.role
+        ):
+            yield from self._buffer(new_content)
+            return
+
+        role = message.role
+        tool_calls = message.tool_calls
+        finish_reason = choice.finish_reason
+
+        if role:
+            # First chunk, so also print the system message
+            yield _ROLE_TEMPLATE.format(role=role, model=chunk.model)
+
+        if not finish_reason:
+            if tool_calls is not None:
+                # Middle chunk with tool calls
+                tool_call = tool_calls[0]
+                self._tool_call_id = tool_call.id or ""
+                func = tool_call.function
+                if func:
+                    self._tool_name = func.name or self._tool_name
+                    self._tool_args_parts.append(func.arguments or "")
+            elif usage := chunk.get("usage"):
+                # Usage chunk
+                self._logger.debug("Response Usage Info: %s", usage)
+            else:
+                # Middle chunk
+                yield from self._buffer(message.content or "")
+        elif finish_reason == "tool_calls":
+            # Flush any buffered content before handling the tool calls
+            if self._content_buffer:
+                yield self._flush()
+
+            # Tool calls, so utilize the tools and feed the output back to the LLM
+            provider = self._provider
+            provider._used_tool = True
+            tool_output = ""
+            tool_args = "".join(self._tool_args_parts)
+
+            # Utilize the tools and log the output
+            if self._tool_call_id:
+                tool = tools.get(self._tool_name)
+                if tool is not None:
+                    yield _TOOL_MSG_PREFIX + self._tool_name + _TOOL_MSG_SUFFIX
+                    tool_output = provider.utilize_tool(
+                        self._tool_name, tool, tool_args
+                    )
+                    self._logger.debug(
+                        "Use tool: %s, Output: %s", self._tool_name, tool_output
+                    )
+                yield "\n"
+
+            # If there are tool outputs, feed them back to the LLM in
+            # the next round
+            if tool_output:
+                self.next_messages = self._messages + provider._compose_tool_messages(
+                    self._tool_call_id, self._tool_name, tool_args, tool_output
+                )
+        elif finish_reason == "stop":
+            # Last chunk, so flush the buffered content, log the full
+            # response, and yield a newline
+            if self._content_buffer:
+                yield self._flush()
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("Response: %s", "".join(self._full_response_parts))
+            yield "\n"
 
 
 class Provider:
@@ -24,6 +215,8 @@ class Provider:
         top_p=None,
         no_tools=False,
         dry_run=False,
+        flush_interval_ms=10,
+        use_cache=False,
     ):
         """
         Provider class for interacting with language models.
@@ -36,12 +229,19 @@ class Provider:
             top_p (float, optional): The top-p value for the model's output. Defaults to None.
             no_tools (bool, optional): Flag to disable tool usage. Defaults to False.
             dry_run (bool, optional): Flag to enable dry run mode. Defaults to False.
+            flush_interval_ms (int, optional): How long streamed chunks may be
+                coalesced before they are yielded, in milliseconds. 0 yields
+                every chunk immediately. Defaults to 10.
+            use_cache (bool, optional): Flag to replay byte-identical requests
+                from the on-disk response cache. Defaults to False.
         """
 
-        if len(model_name.split("/")) != 2:
+        provider, sep, model = model_name.partition("/")
+        if not sep or "/" in model:
             raise ValueError(
                 "The model name should be in the format of 'provider/model'."
             )
+        self.provider: str = provider
         self.model_name: str = model_name
         self.api_key: str | None = api_key
         self.base_url: str | None = base_url
@@ -49,29 +249,41 @@ class Provider:
         self.top_p: float | None = top_p
         self.no_tools: bool = no_tools
         self.dry_run: bool = dry_run
-
-    def utilize_tool(self, name: str, args: str) -> str:
+        self._flush_interval: float = max(flush_interval_ms, 0) / 1000
+        self.use_cache: bool = use_cache
+        self._used_tool: bool = False
+        # Resolve the tool schema list once per instance; every completion
+        # call (including tool-recursion rounds) reuses the same object.
+        self._tools_payload = None if no_tools else _tools_payload()
+        self._logger = LoggerManager.get_logger()
+
+    def utilize_tool(self, name: str, tool: Tool, args: str) -> str:
         """Utilize a tool.
 
         Args:
-            tool (ChoiceDeltaToolCallFunction): The tool to utilize
+            name (str): The name of the tool
+            tool (Tool): The resolved tool to utilize
+            args (str): The JSON-encoded arguments for the tool
 
         Returns:
             str: The output of the tool
         """
 
-        args = args if isinstance(args, dict) else json.loads(args or "{}")
-        if tools.get(name):
-            tool = tools[name]
-            if tool.message:
-                print(tool.message)
-            confirm = input(f"Use tool {name} with arguments {args}? (y/n): ").lower()
-            return (
-                tool.function(**args if isinstance(args, dict) else {"arg": args})
-                if confirm == "y"
-                else "User cancelled."
+        parsed_args = (
+            args if isinstance(args, dict) else (_json.loads(args) if args else {})
+        )
+        if tool.message:
+            print(tool.message)
+        confirm = input(
+            f"Use tool {name} with arguments {parsed_args}? (y/n): "
+        ).lower()
+        return (
+            tool.function(
+                **parsed_args if isinstance(parsed_args, dict) else {"arg": parsed_args}
             )
-        return ""
+            if confirm == "y"
+            else "User cancelled."
+        )
 
     def get_llm_response(
         self, messages: list[litellm.AllMessageValues]
@@ -89,15 +301,12 @@ class Provider:
                 The response from the language model.
         """
 
+        litellm = _load_litellm()
         return litellm.completion(
             # generation config
             model=self.model_name,
             messages=messages,
-            tools=(
-                [tool.openai_tool for tool in tools.values()]
-                if not self.no_tools
-                else None
-            ),
+            tools=self._tools_payload,
             temperature=self.temperature,
             top_p=self.top_p,
             stream=True,
@@ -116,6 +325,11 @@ class Provider:
         """
         Assist the user by generating responses from the language model.
 
+        When the response cache is enabled, a byte-identical request is
+        replayed from disk without calling the model; responses that
+        involved tool execution are never cached, since tools run
+        interactively and can have side effects.
+
         Args:
             messages (list[litellm.AllMessageValues]):
                 A list of messages to send to the model.
@@ -125,74 +339,165 @@ class Provider:
                 A generator yielding the model's responses as strings.
         """
 
-        response = self.get_llm_response(messages)
-
-        # Log the context, prompts, and tool messages
-        logger = LoggerManager.get_logger()
-        logger.debug(f"Context: {messages}")
-
-        full_response: str = ""
-        tool_call_id: str = ""
-        tool_name: str = ""
-        tool_args: str = ""
-        for chunk in response or []:
-            if not isinstance(chunk, ModelResponseStream):
-                continue
-
-            message = chunk.choices[0].delta
-            role = message.role
-            tool_calls = message.tool_calls
-            content = message.content
-            finish_reason = chunk.choices[0].finish_reason
-
-            if role:
-                # First chunk, so also print the system message
-                yield f"{Fore.GREEN}{role}({chunk.model}): {Style.RESET_ALL}"
-
-            if not finish_reason:
-                if tool_calls is not None:
-                    # Middle chunk with tool calls
-                    tool_call = tool_calls[0]
-                    tool_call_id = tool_call.id or ""
-                    func = tool_call.function
-                    if func:
-                        tool_name = func.name or tool_name
-                        tool_args += func.arguments or ""
-                elif usage := chunk.get("usage"):
-                    # Usage chunk
-                    logger.debug(f"Response Usage Info: {usage}")
-                else:
-                    # Middle chunk, so just print the content
-                    new_content = content or ""
-                    full_response += new_content
-                    yield new_content
-            elif finish_reason == "tool_calls":
-                # Tool calls, so utilize the tools and feed the output back to the LLM
-                tool_output = ""
-
-                # Utilize the tools and log the output
-                if tool_call_id:
-                    if tool_name in tools:
-                        yield f"{Fore.GREEN}Using tool {tool_name}...{Style.RESET_ALL}"
-                        tool_output = self.utilize_tool(tool_name, tool_args)
-                        logger.debug(f"Use tool: {tool_name}, Output: {tool_output}")
-                    yield "\n"
-
-                # If there are tool outputs, feed them back to the LLM
-                if tool_output:
-                    for next_response in self.assist(
-                        messages=[
-                            *messages,
-                            *self._compose_tool_messages(
-                                tool_call_id, tool_name, tool_args, tool_output
-                            ),
-                        ]
-                    ):
-                        yield next_response
-            elif finish_reason == "stop":
-                # Last chunk, so log the full response and the response info, and yield a newline
-                logger.debug(f"Response: {full_response}")
-                yield "\n"
+        if not self.use_cache or self.dry_run:
+            yield from self._assist_stream(messages)
+            return
+
+        cache = ResponseCache()
+        key = cache.compute_key(self.model_name, self.temperature, self.top_p, messages)
+        cached = cache.get(key)
+        if cached is not None:
+            self._logger.debug("Response cache hit: %s", key)
+            yield from cached
+            return
+
+        chunks: list[str] = []
+        self._used_tool = False
+        for chunk in self._assist_stream(messages):
+            chunks.append(chunk)
+            yield chunk
+        if not self._used_tool:
+            cache.set(key, chunks)
+
+    def _assist_stream(
+        self,
+        messages: list[litellm.AllMessageValues],
+    ) -> Generator[str, None, None]:
+        """Stream one assistant response, following up on tool calls.
+
+        Args:
+            messages (list[litellm.AllMessageValues]):
+                A list of messages to send to the model.
+
+        Yields:
+            Generator[str, None, None]:
+                A generator yielding the model's responses as strings.
+        """
+
+        # Tool rounds loop here instead of recursing, so a long tool
+        # chain does not stack a generator frame under every token.
+        while True:
+            response = self.get_llm_response(messages)
+
+            # Log the context, prompts, and tool messages
+            self._logger.debug("Context: %s", messages)
+
+            state = _StreamRound(self, messages)
+            for chunk in response or []:
+                yield from state.feed(chunk)
+            if state.next_messages is None:
+                return
+            messages = state.next_messages
+
+    async def aassist(
+        self,
+        messages: list[litellm.AllMessageValues],
+    ) -> AsyncGenerator[str, None]:
+        """
+        Async variant of :meth:`assist` built on ``litellm.acompletion``.
+
+        The stream is consumed without blocking the event loop, so async
+        callers (e.g. an SSE endpoint) can run several streams concurrently
+        or cancel one mid-response. Tool confirmation still reads from
+        stdin, exactly like the sync path.
+
+        Args:
+            messages (list[litellm.AllMessageValues]):
+                A list of messages to send to the model.
+
+        Yields:
+            AsyncGenerator[str, None]:
+                An async generator yielding the model's responses as strings.
+        """
+
+        litellm = _load_litellm()
+        # Tool rounds loop here instead of recursing, so a long tool
+        # chain does not stack a generator frame under every token.
+        while True:
+            response = await litellm.acompletion(
+                # generation config
+                model=self.model_name,
+                messages=messages,
+                tools=self._tools_payload,
+                temperature=self.temperature,
+                top_p=self.top_p,
+                stream=True,
+                stream_options={"include_usage": True},
+                # provider config
+                api_key=self.api_key or None,
+                base_url=self.base_url or None,
+                # dry run
+                mock_response="Dry run completed." if self.dry_run else None,
+            )
+
+            # Log the context, prompts, and tool messages
+            self._logger.debug("Context: %s", messages)
+
+            state = _StreamRound(self, messages)
+            # With stream=True, acompletion returns the stream wrapper;
+            # narrow the annotation (which also covers ModelResponse)
+            # for the async iteration.
+            stream = cast("litellm.CustomStreamWrapper", response)
+            async for chunk in stream:
+                for out in state.feed(chunk):
+                    yield out
+            if state.next_messages is None:
+                return
+            messages = state.next_messages
+
+    def assist_batch(
+        self,
+        messages_batch: list[list[litellm.AllMessageValues]],
+    ) -> list[str]:
+        """
+        Run several independent requests as one batched call.
+
+        litellm fans the requests out concurrently, so the total wall
+        time is close to the slowest request instead of their sum. The
+        responses are not streamed and tools are not invoked; this is
+        meant for scripted usage, not the interactive loop.
+
+        Args:
+            messages_batch (list[list[litellm.AllMessageValues]]):
+                One message list per request.
+
+        Returns:
+            list[str]: The response content for each request, in order.
+        """
+
+        litellm = _load_litellm()
+        responses = litellm.batch_completion(
+            model=self.model_name,
+            messages=messages_batch,
+            temperature=self.temperature,
+            top_p=self.top_p,
+            api_key=self.api_key or None,
+            base_url=self.base_url or None,
+            mock_response="Dry run completed." if self.dry_run else None,
+        )
+        return [response.choices[0].message.content or "" for response in responses]
+
+    def stream_to(
+        self,
+        messages: list[litellm.AllMessageValues],
+        fp: TextIO = sys.stdout,
+    ) -> None:
+        """
+        Stream the assistant's response directly to a file object.
+
+        Each chunk is written and flushed immediately, guaranteeing
+        token-by-token rendering for callers that do not want to manage
+        their own flush policy.
+
+        Args:
+            messages (list[litellm.AllMessageValues]):
+                A list of messages to send to the model.
+            fp (TextIO): The file object to write to. Defaults to stdout.
+        """
+
+        for chunk in self.assist(messages):
+            fp.write(chunk)
+            fp.flush()
 
     @staticmethod
     def _compose_tool_messages(
@@ -215,6 +520,7 @@ class Provider:
                 A list of messages formatted for the language model.
         """
 
+        litellm = _load_litellm()
         return [
             litellm.ChatCompletionAssistantMessage(
                 role="assistant",
@@ -252,17 +558,20 @@ class Provider:
                 for the language model.
         """
 
-        _system_messages = [
+        litellm = _load_litellm()
+        messages: list[litellm.AllMessageValues] = []
+        messages.extend(
             litellm.ChatCompletionSystemMessage(role="system", content=msg)
             for msg in system_messages
-        ]
-        _user_messages = [
+        )
+        messages.extend(
             litellm.ChatCompletionUserMessage(role="user", content=msg)
             for msg in user_messages
-        ]
-        return [*_system_messages, *_user_messages]
+        )
+        return messages
 
 
+@lru_cache(maxsize=None)
 def create_assistant(
     model_name: str,
     temperature: float | None = None,
@@ -280,22 +589,23 @@ def create_assistant(
         dry_run (bool, optional): Dry run mode. Defaults to False.
 
     Returns:
-        OpenAIAPI | MistralAPI | None: The assistant instance or None if the provider or model is not found
+        Provider | None: The assistant instance or None if the provider or model is not found
     """
 
     config = load_config()
-    provider = model_name.split("/")[0]
-    providers_config = config.providers
+    provider = model_name.partition("/")[0]
+    provider_config = config.providers.get(provider)
+    if not provider_config or not provider_config.api_key:
+        return None
     generation_config = config.generation
-    provider_config = providers_config.get(provider) or None
-    if provider_config and provider_config.api_key:
-        return Provider(
-            model_name=model_name,
-            api_key=provider_config.api_key if provider_config else None,
-            base_url=provider_config.base_url if provider_config else None,
-            temperature=(temperature or generation_config.temperature),
-            top_p=(top_p or generation_config.top_p),
-            no_tools=False if no_tools or not generation_config.with_tools else True,
-            dry_run=dry_run,
-        )
-    return None
+    return Provider(
+        model_name=model_name,
+        api_key=provider_config.api_key,
+        base_url=provider_config.base_url,
+        temperature=temperature or generation_config.temperature,
+        top_p=top_p or generation_config.top_p,
+        no_tools=no_tools or not generation_config.with_tools,
+        dry_run=dry_run,
+        flush_interval_ms=generation_config.flush_interval_ms,
+        use_cache=config.response_cache,
+    )
@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+
+# Expanded once at import time; the ASSISTANT_CACHE_DIR override is still
+# read per instance so tests can redirect the cache at runtime.
+_DEFAULT_CACHE_DIR = f"{os.path.expanduser('~')}/.cache/term_assistant/responses"
+
+
+class ResponseCache:
+    """
+    Exact-match cache for streamed assistant responses.
+
+    Responses are stored on disk as JSON chunk lists, keyed on a hash of
+    the model, sampling options, and the full message list, so a repeated
+    byte-identical request replays instantly without a network call (or
+    token billing). The cache directory defaults to
+    ``~/.cache/term_assistant/responses`` and can be overridden with the
+    ``ASSISTANT_CACHE_DIR`` environment variable.
+    """
+
+    def __init__(self, cache_dir: str | None = None):
+        self.cache_dir = cache_dir or os.getenv(
+            "ASSISTANT_CACHE_DIR", _DEFAULT_CACHE_DIR
+        )
+
+    @staticmethod
+    def compute_key(
+        model_name: str,
+        temperature: float | None,
+        top_p: float | None,
+        messages: list,
+    ) -> str:
+        """Compute the cache key for a request.
+
+        Args:
+            model_name (str): The model the request is sent to.
+            temperature (float | None): The sampling temperature.
+            top_p (float | None): The top-p value.
+            messages (list): The full message list sent to the model.
+
+        Returns:
+            str: A stable hex digest identifying the request.
+        """
+
+        payload = json.dumps(
+            [model_name, temperature, top_p, messages],
+            sort_keys=True,
+            default=str,
+        ).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> list[str] | None:
+        """Return the cached response chunks for a key, or None on a miss."""
+
+        try:
+            with open(self._path(key), "rb") as f:
+                return json.loads(f.read())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def set(self, key: str, chunks: list[str]) -> None:
+        """Store the response chunks for a key.
+
+        The write goes through a temporary file and an atomic replace, so
+        a concurrent reader never sees a partial entry.
+        """
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self._path(key)}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(chunks, f)
+        os.replace(tmp_path, self._path(key))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
@@ -1,10 +1,86 @@
+import io
 import os
+import pwd
+import re
+import shlex
 import subprocess
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Iterator, cast
 
 import libtmux
 
 from .logging import LoggerManager
 
+# Compiled once; strips ANSI escape sequences so they do not end up as
+# junk tokens in the prompt.
+_ANSI = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]")
+
+# An EXTENDED_HISTORY zsh entry: ": <timestamp>:<duration>;<command>"
+_ZSH_EXTENDED = re.compile(r"^: \d+:\d+;")
+
+# Default history file per shell, used when $HISTFILE is not exported.
+_HISTFILE_MAP = {
+    "bash": "~/.bash_history",
+    "zsh": "~/.zsh_history",
+    "fish": "~/.local/share/fish/fish_history",
+}
+
+
+@lru_cache(maxsize=1)
+def _tmux_server() -> libtmux.Server:
+    """Return the process-wide tmux server handle.
+
+    The handle just records the socket path, so one instance can serve
+    every history capture in the process.
+    """
+
+    return libtmux.Server()
+
+
+def _read_history_file(size: int) -> list[str]:
+    """Tail the shell's history file without spawning a shell.
+
+    Only a trailing window of the file is read, so the cost stays
+    proportional to the requested number of lines rather than the full
+    history size.
+
+    Args:
+        size (int): The number of lines of history to include.
+                    0 for a small default window.
+
+    Returns:
+        list[str]: The most recent commands, oldest first
+    """
+
+    shell = os.path.basename(get_current_shell())
+    histfile = os.getenv("HISTFILE") or _HISTFILE_MAP.get(shell)
+    if not histfile:
+        return []
+    wanted = size or 50
+    try:
+        with open(os.path.expanduser(histfile), "rb") as f:
+            file_size = f.seek(0, os.SEEK_END)
+            # A generous 256 bytes per wanted line bounds the read.
+            window = min(file_size, wanted * 256)
+            f.seek(file_size - window)
+            raw = f.read().decode("utf-8", errors="replace")
+    except OSError:
+        return []
+    lines = raw.splitlines()
+    if window < file_size and lines:
+        # The first line of a partial window is usually truncated
+        del lines[0]
+    if shell == "fish":
+        lines = [line[7:] for line in lines if line.startswith("- cmd: ")]
+    elif shell == "zsh":
+        # Strip the extended-history prefix only when it is actually
+        # there; plain-format lines may contain semicolons of their own
+        # (e.g. "ls; pwd") and must pass through untouched.
+        lines = [_ZSH_EXTENDED.sub("", line) for line in lines]
+    return lines[-wanted:]
+
 
 def get_history(size: int, all_panes: bool = False) -> list[str]:
     """Get the command history.
@@ -19,22 +95,33 @@ def get_history(size: int, all_panes: bool = False) -> list[str]:
 
     logger = LoggerManager.get_logger()
     if not os.getenv("TMUX"):
-        logger.error(
-            "TMUX environment variable not set, please run inside a tmux session"
+        logger.warning(
+            "TMUX environment variable not set, "
+            "falling back to the shell history file"
         )
-        return []
-    tmux_server = libtmux.Server()
-    session, window, pane = (
-        tmux_server.cmd("display-message", "-p", "#S:#I:#P").stdout[0].split(":")
-    )
+        return _read_history_file(size)
+    tmux_server = _tmux_server()
     captured_texts: list[str] = []
-    raw_panes = tmux_server.cmd("list-panes").stdout
+    # Start the capture `size` lines into the scrollback, so histories larger
+    # than the visible screen are actually preserved instead of sliced away.
+    capture_args = ("-p",) if size == 0 else ("-p", "-S", f"-{size}")
+    # A single formatted list-panes call yields both the active flag and the
+    # globally unique pane id, so no extra display-message round-trip is
+    # needed to figure out which pane the assistant is running in.
+    raw_panes = tmux_server.cmd("list-panes", "-F", "#{pane_active} #{pane_id}").stdout
     for raw_pane in raw_panes:
-        pane_id = raw_pane.split(":")[0]
-        if all_panes or pane_id == pane:
-            captured_texts += tmux_server.cmd(
-                "capture-pane", "-p", "-t", f"{session}:{window}.{pane_id}"
-            ).stdout
+        active, pane_id = raw_pane.split(" ")
+        if all_panes or active == "1":
+            captured_texts += [
+                _ANSI.sub("", line).rstrip()
+                for line in tmux_server.cmd(
+                    "capture-pane", *capture_args, "-t", pane_id
+                ).stdout
+            ]
+    # The bottom of the screen is usually empty rows; dropping them (and the
+    # trailing whitespace above) keeps junk tokens out of the prompt.
+    while captured_texts and not captured_texts[-1]:
+        captured_texts.pop()
     if size == 0:
         return captured_texts
     return captured_texts[-size:]
@@ -50,22 +137,165 @@ def get_current_dir() -> str:
     return os.getcwd()
 
 
+@lru_cache(maxsize=1)
 def get_current_shell() -> str:
     """Get the current shell.
 
+    The shell never changes within one process, so the environment lookup
+    is cached. The current directory is deliberately not cached, since it
+    can change mid-process.
+
     Returns:
         str: The current shell
     """
     return os.environ.get("SHELL", "/usr/bin/bash")
 
 
+# Cap on captured subprocess output; anything beyond this would blow the
+# model's context budget anyway.
+MAX_TOOL_OUTPUT_BYTES = 256 * 1024
+
+# Characters that force full shlex tokenization in _tokenize; all of
+# str.split's whitespace is included so a trailing newline in a tool
+# call does not end up inside the argv entry.
+_SHELL_METACHARS = set(" \t\n\r\f\v\"'\\|<>&$")
+
+
+def _tokenize(command: str) -> list[str]:
+    """Split a command string into argv.
+
+    Bare commands like `pwd` or `whoami` — common for LLM tool calls —
+    skip the shlex state machine entirely.
+    """
+
+    if not _SHELL_METACHARS.intersection(command):
+        return [command]
+    return shlex.split(command)
+
+
+def _drain_stream(stream: io.BufferedReader, parts: list[bytes]) -> None:
+    """Collect a pipe's output on a side thread, bounded like stdout."""
+
+    received = 0
+    for chunk in iter(lambda: stream.read1(65536), b""):
+        if received < MAX_TOOL_OUTPUT_BYTES:
+            parts.append(chunk)
+            received += len(chunk)
+    stream.close()
+
+
+def _builtin_ls(args: list[str]) -> str:
+    if len(args) > 1:
+        # Real ls prints per-directory headers for multiple paths; let it
+        raise OSError
+    # ls hides dotfiles unless -a is given, and flags never reach here
+    names = sorted(os.listdir(args[0] if args else "."))
+    return "\n".join(name for name in names if not name.startswith("."))
+
+
+# The commands the model issues most often can be answered in-process,
+# skipping a fork+exec. Dispatch only covers the plain no-flags forms;
+# anything else falls through to the subprocess path. whoami reports the
+# effective user (matching the binary), not the utmp login name.
+_BUILTIN_COMMANDS: dict[str, Callable[[list[str]], str]] = {
+    "pwd": lambda args: os.getcwd(),
+    "whoami": lambda args: pwd.getpwuid(os.geteuid()).pw_name,
+    "echo": lambda args: " ".join(args),
+    "ls": _builtin_ls,
+}
+
+
 def run_command(command: str) -> str:
     """
     Run a command in the shell and return the output.
+
+    The most common commands (pwd, ls, echo, whoami) are answered
+    in-process without spawning anything. For the rest, output is read
+    in large bounded chunks and capped at MAX_TOOL_OUTPUT_BYTES; a
+    command that exceeds the cap is killed and its output marked as
+    truncated, so `ls -R /` cannot exhaust memory.
     """
 
-    result = subprocess.run(command.split(), capture_output=True, text=True)
-    return result.stdout.strip() + "\n" + result.stderr.strip()
+    try:
+        argv = _tokenize(command)
+    except ValueError as e:
+        # Model-authored commands can carry malformed quoting; report it
+        # as a tool result instead of killing the assist stream
+        return f"Error parsing command {command}: {e}"
+    builtin = _BUILTIN_COMMANDS.get(argv[0]) if argv else None
+    if builtin is not None and not any(arg.startswith("-") for arg in argv[1:]):
+        try:
+            return builtin(argv[1:])
+        except OSError:
+            # Fall through so the real binary reports its canonical
+            # error message (e.g. ls on a missing path)
+            pass
+
+    proc = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    # In binary mode the pipes are BufferedReaders, which expose read1;
+    # the casts narrow both the Optional and the IO[bytes] annotation.
+    stdout_pipe = cast(io.BufferedReader, proc.stdout)
+    stderr_pipe = cast(io.BufferedReader, proc.stderr)
+    # Drain stderr on a side thread so a chatty process cannot fill the
+    # stderr pipe and deadlock against the bounded stdout loop below.
+    stderr_parts: list[bytes] = []
+    stderr_thread = threading.Thread(
+        target=_drain_stream, args=(stderr_pipe, stderr_parts), daemon=True
+    )
+    stderr_thread.start()
+    stdout_parts: list[bytes] = []
+    received = 0
+    truncated = False
+    for chunk in iter(lambda: stdout_pipe.read1(65536), b""):
+        stdout_parts.append(chunk)
+        received += len(chunk)
+        if received >= MAX_TOOL_OUTPUT_BYTES:
+            truncated = True
+            proc.kill()
+            break
+    stdout_pipe.close()
+    stderr_thread.join()
+    proc.wait()
+    # rstrip is enough here: only trailing newlines matter, and it skips
+    # scanning the front of a large capture.
+    stdout = b"".join(stdout_parts).decode("utf-8", errors="replace").rstrip()
+    stderr = b"".join(stderr_parts).decode("utf-8", errors="replace").rstrip()
+    if truncated:
+        stdout += "\n[...truncated]"
+    if not stderr:
+        return stdout
+    return f"{stdout}\n{stderr}" if stdout else stderr
+
+
+def run_command_stream(command: str) -> Iterator[str]:
+    """
+    Run a command in the shell and yield its output line by line.
+
+    Unlike run_command, the output is not buffered until the process
+    exits, so long-running commands can be consumed incrementally.
+    """
+
+    try:
+        argv = _tokenize(command)
+    except ValueError as e:
+        yield f"Error parsing command {command}: {e}"
+        return
+
+    with subprocess.Popen(
+        argv,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+    ) as proc:
+        assert proc.stdout is not None
+        yield from proc.stdout
+
+
+# Repeated read_file tool calls on an unchanged file are served from this
+# LRU; the (mtime, size) part of the key invalidates stale entries.
+_READ_CACHE: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+_READ_CACHE_SIZE = int(os.getenv("TERM_ASSISTANT_READ_CACHE_SIZE", "128"))
 
 
 def read_file(file_path: str) -> str:
@@ -74,8 +304,33 @@ def read_file(file_path: str) -> str:
     """
 
     try:
-        with open(file_path) as f:
-            return f.read()
+        # One open/fstat/read/close round: the file size is known up
+        # front, so the whole content arrives in a single read syscall
+        # with no buffered-IO layer, and the bytes decode once.
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            stat = os.fstat(fd)
+            if stat.st_size == 0:
+                # procfs/sysfs files report a zero size but still have
+                # content: read to EOF instead, and skip the cache since
+                # a (mtime, 0) key says nothing about such files.
+                parts = []
+                while chunk := os.read(fd, 65536):
+                    parts.append(chunk)
+                return b"".join(parts).decode("utf-8", errors="replace")
+            cache_key = (file_path, stat.st_mtime_ns, stat.st_size)
+            content = _READ_CACHE.get(cache_key)
+            if content is not None:
+                _READ_CACHE.move_to_end(cache_key)
+                return content
+            data = os.read(fd, stat.st_size)
+        finally:
+            os.close(fd)
+        content = data.decode("utf-8", errors="replace")
+        _READ_CACHE[cache_key] = content
+        if len(_READ_CACHE) > _READ_CACHE_SIZE:
+            _READ_CACHE.popitem(last=False)
+        return content
     except FileNotFoundError:
         return f"File not found: {file_path}"
     except Exception as e:
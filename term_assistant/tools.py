@@ -1,13 +1,15 @@
-from dataclasses import dataclass
-from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Callable
 
-from openai.types.chat import ChatCompletionToolParam as OpenAITool
-from openai.types.shared_params.function_definition import FunctionDefinition
+if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletionToolParam as OpenAITool
 
 from .terminal import read_file, run_command
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Parameter:
     """
     A class to represent a parameter.
@@ -23,7 +25,9 @@ class Parameter:
     optional: bool = False
 
 
-@dataclass
+# frozen like Parameter, but without slots: cached_property stores the
+# built payload in the instance __dict__, which slots would remove.
+@dataclass(frozen=True)
 class Tool:
     """
     The Tool class represents a tool with a callable function and its parameters.
@@ -39,21 +43,37 @@ class Tool:
     function: Callable
     parameters: dict[str, Parameter]
     message: str = ""
+    name: str = field(init=False, repr=False, compare=False)
+    description: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def openai_tool(self) -> OpenAITool:
+    def __post_init__(self):
+        # Resolved once here rather than on every payload build; the
+        # frozen dataclass requires going through object.__setattr__.
+        object.__setattr__(self, "name", self.function.__name__)
+        object.__setattr__(
+            self,
+            "description",
+            self.function.__doc__.strip() if self.function.__doc__ else "",
+        )
+
+    @cached_property
+    def openai_tool(self) -> "OpenAITool":
         """
         Returns:
             OpenAITool: The tool formatted for OpenAI's API.
+                The payload is built once and cached, since tools are
+                immutable after construction.
         """
 
-        return OpenAITool(
-            function=FunctionDefinition(
-                name=self.function.__name__,
-                description=(
-                    self.function.__doc__.strip() if self.function.__doc__ else ""
-                ),
-                parameters={
+        # ChatCompletionToolParam is a TypedDict, so a plain dict literal
+        # is type-compatible and skips both the openai import and its
+        # constructor call.
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.description,
+                "parameters": {
                     "type": "object",
                     "properties": {
                         k: {"type": v.type, "description": v.description}
@@ -63,9 +83,8 @@ class Tool:
                         k for k, v in self.parameters.items() if not v.optional
                     ],
                 },
-            ),
-            type="function",
-        )
+            },
+        }
 
 
 tools: dict[str, Tool] = {
@@ -78,3 +97,66 @@ tools: dict[str, Tool] = {
         read_file, {"file_path": Parameter("string", "The path to the file to read")}
     ),
 }
+
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared tool thread pool, creating it on first use."""
+
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tool")
+    return _EXECUTOR
+
+
+def run_tools_batch(calls: list[tuple[str, dict]]) -> list[str]:
+    """
+    Run several independent tool calls concurrently.
+
+    The tools are I/O bound (subprocesses, file reads), so fanning a
+    batch out over the shared thread pool finishes in roughly the time
+    of the slowest call instead of their sum.
+
+    Args:
+        calls (list[tuple[str, dict]]): (tool name, keyword arguments)
+            pairs to execute.
+
+    Returns:
+        list[str]: One output per call, in submission order. An unknown
+            tool name yields an error string in its slot instead of
+            failing the whole batch.
+    """
+
+    executor = _get_executor()
+    futures = [
+        executor.submit(tools[name].function, **args) if name in tools else None
+        for name, args in calls
+    ]
+    return [
+        future.result() if future is not None else f"Tool not found: {name}"
+        for (name, _), future in zip(calls, futures)
+    ]
+
+
+def refresh_tool_cache() -> None:
+    """
+    Drop every cached tool payload.
+
+    Only needed if the tools dict is mutated after import (e.g. dynamic
+    tool registration). Clears the per-Tool payloads, the aggregated
+    list in the provider layer, and the create_assistant cache — a
+    Provider resolves its payload once at construction, so memoized
+    assistants must be rebuilt to pick up the new schema. A Provider
+    constructed by hand before the refresh keeps its old list.
+    """
+
+    for tool in tools.values():
+        # cached_property stores its result in the instance dict
+        tool.__dict__.pop("openai_tool", None)
+
+    from .llm import _tools_payload, create_assistant
+
+    _tools_payload.cache_clear()
+    create_assistant.cache_clear()
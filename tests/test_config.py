@@ -15,3 +15,10 @@ def test_load_config():
     assert config.system_messages["default"]
     assert config.providers["openai"].api_key == "sk-xxxxx"
     assert config.providers["ollama"].base_url == "http://localhost:11434"
+
+
+def test_load_config_cached():
+    os.environ["ASSISTANT_CONFIG"] = "tests/assistant.yaml"
+    config = load_config()
+    # Repeated calls in one process must hit the cache, not re-parse the file
+    assert load_config() is config
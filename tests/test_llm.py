@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 from litellm import CustomStreamWrapper
@@ -45,3 +46,35 @@ def test_get_llm_response():
     for chunk in response:
         full_response += chunk.choices[0].delta.content or ""
     assert full_response == "Dry run completed."
+
+
+def test_assist_batch():
+    os.environ["ASSISTANT_CONFIG"] = "tests/assistant.yaml"
+    assistant = create_assistant(
+        model_name="openai/gpt-4o",
+        dry_run=True,
+    )
+    assert assistant is not None
+    responses = assistant.assist_batch(
+        [
+            [{"role": "user", "content": "How to use ps command"}],
+            [{"role": "user", "content": "How to use top command"}],
+        ]
+    )
+    assert responses == ["Dry run completed.", "Dry run completed."]
+
+
+def test_aassist_dry_run():
+    os.environ["ASSISTANT_CONFIG"] = "tests/assistant.yaml"
+    assistant = create_assistant(
+        model_name="openai/gpt-4o",
+        dry_run=True,
+    )
+    assert assistant is not None
+
+    async def collect() -> str:
+        chunks = [chunk async for chunk in assistant.aassist([])]
+        return "".join(chunks)
+
+    full_response = asyncio.run(collect())
+    assert "Dry run completed." in full_response
@@ -0,0 +1,24 @@
+from term_assistant.llm_cache import ResponseCache
+
+
+def test_response_cache_roundtrip(tmp_path):
+    cache = ResponseCache(cache_dir=str(tmp_path))
+    key = cache.compute_key(
+        "openai/gpt-4o",
+        0.7,
+        1.0,
+        [{"role": "user", "content": "How to use ps command"}],
+    )
+    assert cache.get(key) is None
+    cache.set(key, ["Hello, ", "world"])
+    assert cache.get(key) == ["Hello, ", "world"]
+
+
+def test_response_cache_key_depends_on_messages():
+    key_a = ResponseCache.compute_key(
+        "openai/gpt-4o", 0.7, 1.0, [{"role": "user", "content": "a"}]
+    )
+    key_b = ResponseCache.compute_key(
+        "openai/gpt-4o", 0.7, 1.0, [{"role": "user", "content": "b"}]
+    )
+    assert key_a != key_b
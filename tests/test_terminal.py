@@ -1,10 +1,14 @@
 import os
 
+import pytest
+
 from term_assistant.terminal import (
+    _read_history_file,
     get_current_dir,
     get_current_shell,
     read_file,
     run_command,
+    run_command_stream,
 )
 
 
@@ -13,19 +17,30 @@ def test_get_current_dir() -> None:
 
 
 def test_get_current_shell() -> None:
+    # The result is cached per process; clear it so earlier tests that
+    # touched os.environ cannot leak into this assertion.
+    get_current_shell.cache_clear()
     assert get_current_shell() == os.environ.get("SHELL", "/usr/bin/bash")
 
 
-def test_run_command() -> None:
-    result = run_command("ls /")
-    assert "bin" in result
-    result = run_command("pwd")
-    assert os.getcwd() in result
+@pytest.mark.parametrize(
+    "command, expected",
+    [
+        ("ls /", "bin"),
+        ("pwd", os.getcwd()),
+        ("pwd\n", os.getcwd()),
+        ('echo "hello world"', "hello world"),
+        ("ls /notfound", "No such file or directory"),
+        ("echo 'unbalanced", "No closing quotation"),
+    ],
+)
+def test_run_command(command: str, expected: str) -> None:
+    assert expected in run_command(command)
 
 
-def test_run_command_error() -> None:
-    result = run_command("ls /notfound")
-    assert "No such file or directory" in result
+def test_run_command_stream() -> None:
+    lines = list(run_command_stream("ls /"))
+    assert any("bin" in line for line in lines)
 
 
 def test_read_file() -> None:
@@ -35,6 +50,50 @@ def test_read_file() -> None:
     assert read_file("/tmp/test_file.txt") == text
 
 
+def test_read_file_cache_invalidation() -> None:
+    path = "/tmp/test_cache_file.txt"
+    with open(path, "w") as f:
+        f.write("first")
+    assert read_file(path) == "first"
+    with open(path, "w") as f:
+        f.write("second")
+    os.utime(path, ns=(0, 0))
+    assert read_file(path) == "second"
+
+
+def test_read_history_file_zsh(monkeypatch, tmp_path) -> None:
+    histfile = tmp_path / "history"
+    histfile.write_text(": 1700000000:0;echo extended\nls; pwd\n")
+    monkeypatch.setenv("SHELL", "/bin/zsh")
+    monkeypatch.setenv("HISTFILE", str(histfile))
+    get_current_shell.cache_clear()
+    try:
+        # Only the extended-format prefix is stripped; a plain line with
+        # a semicolon stays intact.
+        assert _read_history_file(2) == ["echo extended", "ls; pwd"]
+    finally:
+        get_current_shell.cache_clear()
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/version"), reason="needs procfs")
+def test_read_file_zero_size_procfs() -> None:
+    # procfs files stat as zero bytes but still have content
+    assert "Linux" in read_file("/proc/version")
+
+
 def test_read_file_not_found() -> None:
     filename = "/tmp/not_found.txt"
     assert read_file(filename) == f"File not found: {filename}"
+
+
+def test_read_history_file(monkeypatch, tmp_path) -> None:
+    histfile = tmp_path / "history"
+    histfile.write_text("\n".join(f"command {i}" for i in range(100)) + "\n")
+    monkeypatch.setenv("SHELL", "/bin/bash")
+    monkeypatch.setenv("HISTFILE", str(histfile))
+    get_current_shell.cache_clear()
+    try:
+        lines = _read_history_file(3)
+        assert lines == ["command 97", "command 98", "command 99"]
+    finally:
+        get_current_shell.cache_clear()
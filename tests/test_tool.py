@@ -1,4 +1,4 @@
-from term_assistant.tools import Parameter, Tool
+from term_assistant.tools import Parameter, Tool, run_tools_batch
 
 
 def foo_1() -> None:
@@ -55,3 +55,14 @@ def test_openai_tool() -> None:
     assert properties != {}
     assert type(properties) is dict
     assert properties["bar"]["type"] == "str"
+
+
+def test_run_tools_batch():
+    results = run_tools_batch(
+        [
+            ("run_command", {"command": "echo batched"}),
+            ("no_such_tool", {}),
+        ]
+    )
+    assert "batched" in results[0]
+    assert results[1] == "Tool not found: no_such_tool"